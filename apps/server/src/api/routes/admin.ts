@@ -1,16 +1,11 @@
 import { Elysia, t } from "elysia";
 
 import { Yae } from "@yae/core";
-import type { Webhook } from "@yae/db";
 import { adminAuth } from "../middleware";
 import { authRateLimit } from "../ratelimit";
 
 const SLUG_PATTERN = /^[a-z0-9][a-z0-9-]*$/;
 
-function stripSecret({ secret: _, ...rest }: Webhook) {
-  return rest;
-}
-
 export const adminRoutes = new Elysia({ name: "admin-routes" })
   .use(authRateLimit)
   .group("/admin", (app) =>
@@ -74,7 +69,7 @@ export const adminRoutes = new Elysia({ name: "admin-routes" })
       .get("/webhooks", async () => {
         const yae = Yae.getInstance();
         const webhooks = await yae.webhooks.list();
-        return { webhooks: webhooks.map(stripSecret) };
+        return { webhooks };
       })
       .patch(
         "/webhooks/:id",
@@ -51,12 +51,12 @@ export const webhookRoutes = new Elysia({ name: "webhook-routes" })
     // Idempotency: de-duplicate by x-webhook-id
     const externalId = headers["x-webhook-id"] ?? null;
     if (externalId) {
-      const existing = await yae.webhooks.findByExternalId(
+      const existingId = await yae.webhooks.findEventIdByExternalId(
         webhook.id,
         externalId,
       );
-      if (existing) {
-        return { received: true, event_id: existing.id };
+      if (existingId) {
+        return { received: true, event_id: existingId };
       }
     }
 
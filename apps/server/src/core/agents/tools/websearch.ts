@@ -1,5 +1,47 @@
 import { z } from "zod";
 
+const apiKeys = new Map<string, string>();
+
+/** Read an API key from the environment once and reuse it for later calls. */
+function requiredEnv(name: string): string {
+  let value = apiKeys.get(name);
+  if (value === undefined) {
+    value = process.env[name];
+    if (!value) throw new Error(`Missing environment variable: ${name}`);
+    apiKeys.set(name, value);
+  }
+  return value;
+}
+
+/**
+ * POST a JSON body and return the parsed JSON response. Bun's fetch keeps
+ * connections alive per origin, so repeated calls to the same provider reuse
+ * the pooled socket rather than re-handshaking.
+ */
+async function postJson(
+  provider: string,
+  url: string,
+  apiKey: string,
+  body: unknown,
+): Promise<unknown> {
+  const response = await fetch(url, {
+    method: "POST",
+    headers: {
+      Authorization: `Bearer ${apiKey}`,
+      "Content-Type": "application/json",
+    },
+    body: JSON.stringify(body),
+  });
+
+  if (!response.ok) {
+    throw new Error(
+      `${provider} API error: ${response.status} ${response.statusText}`,
+    );
+  }
+
+  return response.json();
+}
+
 // ============================================================================
 // Tavily Web Search Tool
 // ============================================================================
@@ -31,30 +73,19 @@ export async function searchTavily(
   depth: "basic" | "advanced",
   topic: "general" | "news" | "finance",
 ): Promise<TavilySearchResult> {
-  const response = await fetch("https://api.tavily.com/search", {
-    method: "POST",
-    headers: {
-      Authorization: `Bearer ${process.env.TAVILY_API_KEY}`,
-      "Content-Type": "application/json",
-    },
-    body: JSON.stringify({
+  const data = await postJson(
+    "Tavily",
+    "https://api.tavily.com/search",
+    requiredEnv("TAVILY_API_KEY"),
+    {
       query: query,
       include_answer: depth,
       topic: topic,
       search_depth: depth,
-    }),
-  });
-
-  if (!response.ok) {
-    throw new Error(
-      `Tavily API error: ${response.status} ${response.statusText}`,
-    );
-  }
-
-  const data = await response.json();
-  const result = tavilySearchResultSchema.parse(data);
+    },
+  );
 
-  return result;
+  return tavilySearchResultSchema.parse(data);
 }
 
 // ============================================================================
@@ -89,59 +120,37 @@ export async function searchLinkup(
   query: string,
   depth: "standard" | "deep",
 ): Promise<LinkupSearchResult> {
-  const response = await fetch("https://api.linkup.so/v1/search", {
-    method: "POST",
-    headers: {
-      Authorization: `Bearer ${process.env.LINKUP_API_KEY}`,
-      "Content-Type": "application/json",
-    },
-    body: JSON.stringify({
+  const data = await postJson(
+    "LinkUp",
+    "https://api.linkup.so/v1/search",
+    requiredEnv("LINKUP_API_KEY"),
+    {
       q: query,
       depth: depth,
       outputType: "sourcedAnswer",
       includeImages: false,
       includeInlineCitations: false,
-    }),
-  });
-
-  if (!response.ok) {
-    throw new Error(
-      `LinkUp API error: ${response.status} ${response.statusText}`,
-    );
-  }
-
-  const data = await response.json();
-  const result = linkupSearchResultSchema.parse(data);
+    },
+  );
 
-  return result;
+  return linkupSearchResultSchema.parse(data);
 }
 
 export async function fetchLinkup(
   url: string,
   renderJs: boolean = false,
 ): Promise<LinkupFetchResult> {
-  const response = await fetch("https://api.linkup.so/v1/fetch", {
-    method: "POST",
-    headers: {
-      Authorization: `Bearer ${process.env.LINKUP_API_KEY}`,
-      "Content-Type": "application/json",
-    },
-    body: JSON.stringify({
+  const data = await postJson(
+    "LinkUp",
+    "https://api.linkup.so/v1/fetch",
+    requiredEnv("LINKUP_API_KEY"),
+    {
       url: url,
       includeRawHtml: false,
       renderJs: renderJs,
       extractImages: false,
-    }),
-  });
-
-  if (!response.ok) {
-    throw new Error(
-      `LinkUp API error: ${response.status} ${response.statusText}`,
-    );
-  }
-
-  const data = await response.json();
-  const result = linkupFetchResultSchema.parse(data);
+    },
+  );
 
-  return result;
+  return linkupFetchResultSchema.parse(data);
 }
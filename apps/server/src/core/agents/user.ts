@@ -26,7 +26,6 @@ import {
   truncateResult,
   withTimeout,
 } from "./utils";
-import { fetchLinkup, searchLinkup } from "./tools/websearch";
 import personaRaw from "./prompts/persona.md" with { type: "text" };
 import humanRaw from "./prompts/human.md" with { type: "text" };
 import summaryRaw from "./prompts/conversation.md" with { type: "text" };
@@ -55,16 +54,15 @@ export async function* runAgentLoop(
   // Pre-flight: kick off summarization in parallel if threshold exceeded
   let summarizePromise: Promise<WorkflowResult<unknown> | null> | null = null;
   if (agent.messages.getMessageHistory().length >= MAX_CONVERSATION_HISTORY) {
-    summarizePromise = agent.runWorkflow(summarizeWorkflow).catch((err) => {
-      console.error("[summarize] workflow failed:", err);
-      return null;
-    });
+    summarizePromise = agent.summarize();
   }
 
   // Agent is already initialized via factory
-  const allResults: string[] = [];
   let responded = false;
 
+  // Rendered results of every tool call so far, sent with each turn
+  let toolResults = "";
+
   for (let step = 0; step < maxSteps; step++) {
     const context = await agent.buildContext();
 
@@ -75,7 +73,7 @@ export async function* runAgentLoop(
           query: message.content,
           history: agent.messages.getMessageHistory(),
           memory: context,
-          tool_results: allResults.join("\n")
+          tool_results: toolResults,
         }),
         LLM_TIMEOUT_MS,
         "LLM call",
@@ -91,8 +89,7 @@ export async function* runAgentLoop(
     // UserAgentResponse → final message, exit loop
     if ("message" in agentStep) {
       const content = agentStep.message;
-      await agent.messages.save(message);
-      await agent.messages.save({ role: "assistant", content });
+      await agent.messages.saveMany([message, { role: "assistant", content }]);
       yield { type: "MESSAGE", content };
       responded = true;
       break;
@@ -118,19 +115,21 @@ export async function* runAgentLoop(
       MAX_TOOL_CONCURRENCY,
     );
 
+    const stepResults: string[] = [];
     for (const [i, result] of settled.entries()) {
       const toolName = agentStep.tools[i]!.tool_name;
       if (result.status === "fulfilled") {
         const value = truncateResult(result.value, MAX_TOOL_RESULT_CHARS);
         const str = `<tool_result step="${step + 1}" tool="${toolName}">${value}</tool_result>`;
-        allResults.push(str);
+        stepResults.push(str);
         yield { type: "TOOL_RESULT", content: str };
       } else {
         const str = `<tool_error step="${step + 1}" tool="${toolName}">${result.reason}</tool_error>`;
-        allResults.push(str);
+        stepResults.push(str);
         yield { type: "TOOL_ERROR", content: str };
       }
     }
+    toolResults += (toolResults ? "\n" : "") + stepResults.join("\n");
   }
 
   // Fallback when max steps exhausted without a response
@@ -140,9 +139,8 @@ export async function* runAgentLoop(
     // Only persist when work actually happened (tools ran). If the LLM
     // failed on the very first call, don't pollute history with a
     // synthetic exchange the model never saw.
-    if (allResults.length > 0) {
-      await agent.messages.save(message);
-      await agent.messages.save({ role: "assistant", content });
+    if (toolResults) {
+      await agent.messages.saveMany([message, { role: "assistant", content }]);
     }
     yield { type: "ERROR", content };
   }
@@ -156,6 +154,8 @@ export async function* runAgentLoop(
 // --- UserAgent ---
 
 export class UserAgent {
+  private summarizing: Promise<WorkflowResult<unknown> | null> | null = null;
+
   private constructor(
     public readonly id: string,
     private readonly ctx: AgentContext,
@@ -211,6 +211,22 @@ export class UserAgent {
     }
   }
 
+  /**
+   * Summarize older conversation history. Overlapping calls coalesce onto the
+   * run already in flight, so at most one summarization runs per agent.
+   */
+  summarize(): Promise<WorkflowResult<unknown> | null> {
+    this.summarizing ??= this.runWorkflow(summarizeWorkflow)
+      .catch((err) => {
+        console.error("[summarize] workflow failed:", err);
+        return null;
+      })
+      .finally(() => {
+        this.summarizing = null;
+      });
+    return this.summarizing;
+  }
+
   private async initState(): Promise<void> {
     if (this.memory.has("persona") || this.memory.has("human")) return;
 
@@ -270,6 +286,7 @@ export class UserAgent {
         await this.files.unlink(tool.path);
         return `File "${tool.path}" deleted.`;
       case "web_search": {
+        const { searchLinkup } = await import("./tools/websearch");
         const depth = tool.depth === "deep" ? "deep" : "standard";
         const result = await searchLinkup(tool.query, depth);
         return result.answer;
@@ -278,6 +295,7 @@ export class UserAgent {
         if (!isPublicUrl(tool.url)) {
           throw new Error("Blocked URL: only public http(s) URLs are allowed");
         }
+        const { fetchLinkup } = await import("./tools/websearch");
         const result = await fetchLinkup(tool.url, tool.render);
         return result.markdown;
       }
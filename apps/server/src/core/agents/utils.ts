@@ -1,10 +1,38 @@
 import type { Memory } from "@yae/db";
 
+const SLOT = "\u0000";
+
+// Template strings arrays are unique per call site, so each template is
+// dedented once and reused on every later call.
+const dedentCache = new WeakMap<TemplateStringsArray, string[]>();
+
+function dedentStrings(strings: TemplateStringsArray): string[] {
+  const cached = dedentCache.get(strings);
+  if (cached) return cached;
+
+  const lines = strings.join(SLOT).split("\n");
+  if (lines[0]?.trim() === "") lines.shift();
+  if (lines.at(-1)?.trim() === "") lines.pop();
+  const indent = Math.min(
+    ...lines.filter((l) => l.trim()).map((l) => l.match(/^\s*/)![0].length),
+  );
+  const parts = lines
+    .map((l) => l.slice(indent))
+    .join("\n")
+    .split(SLOT);
+
+  dedentCache.set(strings, parts);
+  return parts;
+}
+
 /**
  * Tagged template literal that strips common leading indentation from
  * multi-line strings. Removes the first and last lines if they are empty
  * (as they typically are with indented template literals).
  *
+ * Only the literal parts of the template are dedented, once per call site;
+ * interpolated values are inserted verbatim afterwards.
+ *
  * Use for structured text where line breaks should be preserved.
  *
  * @example
@@ -18,17 +46,10 @@ export function dedent(
   strings: TemplateStringsArray,
   ...values: unknown[]
 ): string {
-  const result = strings.reduce(
+  return dedentStrings(strings).reduce(
     (acc, str, i) => acc + str + (values[i] ?? ""),
     "",
   );
-  const lines = result.split("\n");
-  if (lines[0]?.trim() === "") lines.shift();
-  if (lines.at(-1)?.trim() === "") lines.pop();
-  const indent = Math.min(
-    ...lines.filter((l) => l.trim()).map((l) => l.match(/^\s*/)![0].length),
-  );
-  return lines.map((l) => l.slice(indent)).join("\n");
 }
 
 /**
@@ -166,34 +187,35 @@ export function truncateResult(value: string, max: number): string {
   return value.slice(0, max) + "\n[truncated]";
 }
 
+const DAY_NAMES = [
+  "Sunday",
+  "Monday",
+  "Tuesday",
+  "Wednesday",
+  "Thursday",
+  "Friday",
+  "Saturday",
+];
+
+const MONTH_NAMES = [
+  "January",
+  "February",
+  "March",
+  "April",
+  "May",
+  "June",
+  "July",
+  "August",
+  "September",
+  "October",
+  "November",
+  "December",
+];
+
 export function getCurrentDatetime(date: Date = new Date()): string {
-  const dayNames = [
-    "Sunday",
-    "Monday",
-    "Tuesday",
-    "Wednesday",
-    "Thursday",
-    "Friday",
-    "Saturday",
-  ];
-  const dayOfWeek = dayNames[date.getDay()];
+  const dayOfWeek = DAY_NAMES[date.getDay()];
   const day = date.getDate();
-
-  const monthNames = [
-    "January",
-    "February",
-    "March",
-    "April",
-    "May",
-    "June",
-    "July",
-    "August",
-    "September",
-    "October",
-    "November",
-    "December",
-  ];
-  const month = monthNames[date.getMonth()];
+  const month = MONTH_NAMES[date.getMonth()];
   const year = date.getFullYear();
 
   let hours = date.getHours();
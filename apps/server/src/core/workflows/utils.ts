@@ -206,6 +206,8 @@ export async function runWorkflow<T>(
 ): Promise<WorkflowResult<T>> {
   const id = crypto.randomUUID();
   const started_at = Date.now();
+  // Monotonic clock for duration; Date.now() can jump with wall-clock changes
+  const startedPerf = performance.now();
 
   const { flow, initialState: state } = workflow.create(initialData);
 
@@ -255,7 +257,7 @@ export async function runWorkflow<T>(
     run: id,
     status: finalStatus,
     state: agentState.data,
-    duration: Date.now() - started_at,
+    duration: Math.round(performance.now() - startedPerf),
     error,
   };
 }
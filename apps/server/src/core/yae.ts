@@ -22,9 +22,14 @@ export type HealthStatus = {
 
 export class Yae {
   private static instance: Yae | null = null;
+  private static initializing: Promise<Yae> | null = null;
   private readonly startTime = Date.now();
   private readonly adminToken: string;
   private userAgents = new Map<string, UserAgent>();
+  private pendingAgents = new Map<string, Promise<UserAgent>>();
+  // Users resolved by token. Rows never change after registration, so only
+  // deletion needs to invalidate. Misses are not cached.
+  private usersByToken = new Map<string, User>();
 
   // Worker pool
   private availableWorkers: WorkerAgent[] = [];
@@ -52,11 +57,18 @@ export class Yae {
   static async initialize(): Promise<Yae> {
     if (Yae.instance) return Yae.instance;
 
-    const admin = await AdminContext.create(DATA_DIR + "/yae.db");
-
-    Yae.instance = new Yae(admin);
-    Yae.instance.initializePool();
-    return Yae.instance;
+    // Concurrent callers share one in-flight initialization
+    Yae.initializing ??= (async () => {
+      const admin = await AdminContext.create(DATA_DIR + "/yae.db");
+      const yae = new Yae(admin);
+      yae.initializePool();
+      Yae.instance = yae;
+      return yae;
+    })().finally(() => {
+      Yae.initializing = null;
+    });
+
+    return Yae.initializing;
   }
 
   private initializePool(size: number = Yae.DEFAULT_POOL_SIZE): void {
@@ -105,18 +117,27 @@ export class Yae {
 
   async createUserAgent(userId: string): Promise<UserAgent> {
     const existing = this.userAgents.get(userId);
-    if (existing) {
-      console.log(`[Yae] Reusing existing agent for user ${userId}`);
-      return existing;
-    }
-    console.log(`[Yae] Creating new agent for user ${userId}`);
+    if (existing) return existing;
+
+    // Concurrent first requests for a user share one open of its databases
+    const pending = this.pendingAgents.get(userId);
+    if (pending) return pending;
+
+    const creating = (async () => {
+      console.log(`[Yae] Creating new agent for user ${userId}`);
 
-    const agentId = `agent_${userId}`;
-    const ctx = await AgentContext.create(agentId, AGENTS_DB_DIR);
-    const agent = await UserAgent.create(agentId, ctx);
+      const agentId = `agent_${userId}`;
+      const ctx = await AgentContext.create(agentId, AGENTS_DB_DIR);
+      const agent = await UserAgent.create(agentId, ctx);
 
-    this.userAgents.set(userId, agent);
-    return agent;
+      this.userAgents.set(userId, agent);
+      return agent;
+    })().finally(() => {
+      this.pendingAgents.delete(userId);
+    });
+
+    this.pendingAgents.set(userId, creating);
+    return creating;
   }
 
   getUserAgent(userId: string): UserAgent | undefined {
@@ -143,7 +164,12 @@ export class Yae {
   }
 
   async getUserByToken(token: string): Promise<User | null> {
-    return this.admin.users.getByToken(token);
+    const cached = this.usersByToken.get(token);
+    if (cached) return cached;
+
+    const user = await this.admin.users.getByToken(token);
+    if (user) this.usersByToken.set(token, user);
+    return user;
   }
 
   async getUserById(id: string): Promise<User | null> {
@@ -155,7 +181,11 @@ export class Yae {
   }
 
   async deleteUser(id: string): Promise<boolean> {
-    return this.admin.users.delete(id);
+    const deleted = await this.admin.users.delete(id);
+    for (const [token, user] of this.usersByToken) {
+      if (user.id === id) this.usersByToken.delete(token);
+    }
+    return deleted;
   }
 
   // ─────────────────────────────────────────────────────────────
@@ -182,10 +212,10 @@ export class Yae {
     this.availableWorkers = [];
     this.busyWorkers.clear();
 
-    // Close all agent connections
-    for (const agent of this.userAgents.values()) {
-      await agent.close();
-    }
+    // Close all agent connections — each agent owns its own files
+    await Promise.all(
+      Array.from(this.userAgents.values(), (agent) => agent.close()),
+    );
     this.userAgents.clear();
 
     this.admin.close();
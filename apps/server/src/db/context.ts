@@ -8,8 +8,6 @@ import { drizzle } from "drizzle-orm/bun-sqlite";
 import { migrate } from "drizzle-orm/bun-sqlite/migrator";
 
 import { AGENT_MIGRATIONS_DIR, ADMIN_MIGRATIONS_DIR } from "../constants.ts";
-import * as schema from "./schemas/agent-schema.ts";
-import * as adminSchema from "./schemas/admin-schema.ts";
 import { MemoryRepository } from "./repositories/memory.ts";
 import { MessagesRepository } from "./repositories/messages.ts";
 import { FileRepository } from "./repositories/files.ts";
@@ -23,24 +21,89 @@ async function ensureDir(dir: string) {
   }
 }
 
+/** Connection-scoped settings; SQLite resets these on every new connection. */
+const CONNECTION_PRAGMAS = [
+  "PRAGMA busy_timeout = 5000",
+  "PRAGMA cache_size = -64000", // 64 MiB
+  "PRAGMA temp_store = MEMORY",
+];
+
+/** File-backed settings; meaningless for in-memory databases. */
+const FILE_PRAGMAS = [
+  "PRAGMA journal_mode = WAL",
+  "PRAGMA synchronous = NORMAL",
+  "PRAGMA journal_size_limit = 67108864", // 64 MiB
+  "PRAGMA mmap_size = 268435456", // 256 MiB
+];
+
+/**
+ * Apply the full pragma set once, right after the connection is opened.
+ * WAL lets readers proceed during writes and, paired with synchronous=NORMAL,
+ * drops the per-commit fsync.
+ */
+function configureDatabase(client: Database, inMemory: boolean): void {
+  const pragmas = inMemory
+    ? CONNECTION_PRAGMAS
+    : [...CONNECTION_PRAGMAS, ...FILE_PRAGMAS];
+  for (const pragma of pragmas) {
+    client.exec(pragma);
+  }
+}
+
 async function verifyTables(
   db: ReturnType<typeof drizzle>,
   tables: string[],
 ): Promise<void> {
-  for (const name of tables) {
-    try {
-      const result = await db.get<{ name: string }>(
-        sql`SELECT name FROM sqlite_master WHERE type='table' AND name=${name}`,
-      );
-      if (!result) {
-        throw new Error(`table "${name}" not found`);
-      }
-    } catch (err) {
-      throw new Error(
-        `Migration verification failed: table "${name}" not found`,
-        { cause: err },
-      );
+  const names = sql.join(tables.map((name) => sql`${name}`), sql`, `);
+  const describe = (list: string[]) =>
+    list.map((name) => `table "${name}"`).join(", ");
+
+  // If the query itself fails, report every expected table as unverified
+  let missing = tables;
+  try {
+    const rows = await db.all<{ name: string }>(
+      sql`SELECT name FROM sqlite_master WHERE type='table' AND name IN (${names})`,
+    );
+    const found = new Set(rows.map((row) => row.name));
+    missing = tables.filter((name) => !found.has(name));
+    if (missing.length > 0) {
+      throw new Error(`${describe(missing)} not found`);
     }
+  } catch (err) {
+    throw new Error(
+      `Migration verification failed: ${describe(missing)} not found`,
+      { cause: err },
+    );
+  }
+}
+
+/**
+ * Open a SQLite database, apply connection pragmas and migrations, and verify
+ * the expected tables exist. Shared by AgentContext and AdminContext.
+ */
+async function openDatabase(
+  path: string,
+  opts: {
+    migrationsFolder: string;
+    migrationsTable: string;
+    tables: string[];
+  },
+): Promise<{ client: Database; db: ReturnType<typeof drizzle> }> {
+  const client = new Database(path);
+  try {
+    configureDatabase(client, path === ":memory:");
+    // No schema is registered: repositories use the query builder only, so the
+    // relational query API (and its startup cost) isn't needed.
+    const db = drizzle(client);
+    await migrate(db, {
+      migrationsFolder: opts.migrationsFolder,
+      migrationsTable: opts.migrationsTable,
+    });
+    await verifyTables(db, opts.tables);
+    return { client, db };
+  } catch (err) {
+    client.close();
+    throw err;
   }
 }
 
@@ -77,17 +140,26 @@ export class AgentContext {
     }
 
     const fs = await AgentFS.open({ path: fsFile });
-    const client = new Database(dbFile);
-    const db = drizzle(client, { schema });
-    await migrate(db, {
-      migrationsFolder: AGENT_MIGRATIONS_DIR,
-      migrationsTable: "__drizzle_migrations_agent",
-    });
-    await verifyTables(db, ["memory", "messages"]);
+    let opened: Awaited<ReturnType<typeof openDatabase>>;
+    try {
+      opened = await openDatabase(dbFile, {
+        migrationsFolder: AGENT_MIGRATIONS_DIR,
+        migrationsTable: "__drizzle_migrations_agent",
+        tables: ["memory", "messages"],
+      });
+    } catch (err) {
+      await fs.close();
+      throw err;
+    }
 
-    const ctx = new AgentContext(agentId, db, client, fs);
-    await ctx.memory.load();
-    await ctx.messages.load();
+    const ctx = new AgentContext(agentId, opened.db, opened.client, fs);
+    try {
+      await ctx.memory.load();
+      await ctx.messages.load();
+    } catch (err) {
+      await ctx.close();
+      throw err;
+    }
 
     return ctx;
   }
@@ -116,18 +188,11 @@ export class AdminContext {
     const dir = dbPath.substring(0, dbPath.lastIndexOf("/"));
     await ensureDir(dir);
 
-    const client = new Database(dbPath);
-    const db = drizzle(client, { schema: adminSchema });
-    await migrate(db, {
+    const { client, db } = await openDatabase(dbPath, {
       migrationsFolder: ADMIN_MIGRATIONS_DIR,
       migrationsTable: "__drizzle_migrations_admin",
+      tables: ["users", "webhooks", "webhook_events", "workflow_runs"],
     });
-    await verifyTables(db, [
-      "users",
-      "webhooks",
-      "webhook_events",
-      "workflow_runs",
-    ]);
 
     const ctx = new AdminContext(db, client);
 
@@ -86,14 +86,24 @@ export class FileRepository {
     }
   }
 
-  async getFileTree(path: string, indent = "", isRoot = true): Promise<string> {
-    let tree = "";
-    const entries = await this.client.fs.readdirPlus(path);
+  async getFileTree(path: string): Promise<string> {
+    const lines: string[] = [];
+    await this.collectFileTree(path, "", lines);
 
-    if (entries.length === 0 && isRoot) {
+    if (lines.length === 0) {
       return "(No files stored yet)";
     }
 
+    return lines.join("\n") + "\n";
+  }
+
+  private async collectFileTree(
+    path: string,
+    indent: string,
+    lines: string[],
+  ): Promise<void> {
+    const entries = await this.client.fs.readdirPlus(path);
+
     entries.sort((a, b) => {
       if (a.stats.isDirectory() && !b.stats.isDirectory()) return -1;
       if (!a.stats.isDirectory() && b.stats.isDirectory()) return 1;
@@ -104,28 +114,32 @@ export class FileRepository {
       const entryPath =
         path === "/" ? `/${entry.name}` : `${path}/${entry.name}`;
       if (entry.stats.isDirectory()) {
-        tree += `${indent}├── ${entry.name}/\n`;
-        tree += await this.getFileTree(entryPath, `${indent}│   `, false);
+        lines.push(`${indent}├── ${entry.name}/`);
+        await this.collectFileTree(entryPath, `${indent}│   `, lines);
       } else {
-        tree += `${indent}└── ${entry.name} (${entry.stats.size}b)\n`;
+        lines.push(`${indent}└── ${entry.name} (${entry.stats.size}b)`);
       }
     }
-
-    return tree;
   }
 
-  async getFlatFileList(
-    path: string,
-    parent = "",
-    isRoot = true,
-  ): Promise<string> {
-    let fileList: string[] = [];
-    const entries = await this.client.fs.readdirPlus(path);
+  async getFlatFileList(path: string): Promise<string> {
+    const files: string[] = [];
+    await this.collectFlatFileList(path, "", files);
 
-    if (entries.length === 0 && isRoot) {
+    if (files.length === 0) {
       return "(No files stored yet)";
     }
 
+    return files.join("\n");
+  }
+
+  private async collectFlatFileList(
+    path: string,
+    parent: string,
+    files: string[],
+  ): Promise<void> {
+    const entries = await this.client.fs.readdirPlus(path);
+
     entries.sort((a, b) => {
       if (a.stats.isDirectory() && !b.stats.isDirectory()) return -1;
       if (!a.stats.isDirectory() && b.stats.isDirectory()) return 1;
@@ -135,18 +149,15 @@ export class FileRepository {
     for (const entry of entries) {
       const entryPath = parent ? `${parent}/${entry.name}` : entry.name;
       if (entry.stats.isDirectory()) {
-        const subDirFiles = await this.getFlatFileList(
+        await this.collectFlatFileList(
           path === "/" ? `/${entry.name}` : `${path}/${entry.name}`,
           entryPath,
-          false,
+          files,
         );
-        fileList = fileList.concat(subDirFiles);
       } else {
-        fileList.push(entryPath);
+        files.push(entryPath);
       }
     }
-
-    return fileList.join("\n");
   }
 
   async toXML(path: string): Promise<string> {
@@ -1,4 +1,4 @@
-import { asc, count, desc } from "drizzle-orm";
+import { asc, count, desc, notInArray } from "drizzle-orm";
 import type { drizzle } from "drizzle-orm/bun-sqlite";
 import { messagesTable } from "../schemas/agent-schema.ts";
 import type { Message } from "../types.ts";
@@ -13,17 +13,22 @@ export class MessagesRepository {
     return this.conversations;
   }
 
+  /**
+   * Everything older than the most recent MAX_CONVERSATION_HISTORY messages,
+   * oldest first.
+   */
   async getMessagesForSummarization(): Promise<Message[]> {
-    const totalMessages = await this.getTotalCount();
-    if (totalMessages <= MAX_CONVERSATION_HISTORY) {
-      return [];
-    }
+    const recent = this.db
+      .select({ id: messagesTable.id })
+      .from(messagesTable)
+      .orderBy(desc(messagesTable.created_at), desc(messagesTable.id))
+      .limit(MAX_CONVERSATION_HISTORY);
 
     const rows = await this.db
       .select()
       .from(messagesTable)
-      .orderBy(asc(messagesTable.created_at))
-      .limit(totalMessages - MAX_CONVERSATION_HISTORY);
+      .where(notInArray(messagesTable.id, recent))
+      .orderBy(asc(messagesTable.created_at), asc(messagesTable.id));
 
     return rows.map((r) => ({
       role: r.role,
@@ -39,6 +44,15 @@ export class MessagesRepository {
     this.conversations.push(message);
   }
 
+  /** Persist several messages with a single multi-row insert. */
+  async saveMany(messages: Message[]): Promise<void> {
+    if (messages.length === 0) return;
+    await this.db
+      .insert(messagesTable)
+      .values(messages.map((m) => ({ role: m.role, content: m.content })));
+    this.conversations.push(...messages);
+  }
+
   async getTotalCount(): Promise<number> {
     const result = await this.db.select({ total: count() }).from(messagesTable);
     return result[0]?.total ?? 0;
@@ -58,12 +72,19 @@ export class MessagesRepository {
   }
 
   async load(limit: number = MAX_CONVERSATION_HISTORY): Promise<void> {
-    const rows = await this.db
+    // Newest `limit` rows, returned oldest-first by SQLite. The id tiebreak
+    // keeps rows inserted in the same millisecond in insertion order.
+    const recent = this.db
       .select()
       .from(messagesTable)
-      .orderBy(desc(messagesTable.created_at))
-      .limit(limit);
-    this.conversations = rows.reverse().map((r) => ({
+      .orderBy(desc(messagesTable.created_at), desc(messagesTable.id))
+      .limit(limit)
+      .as("recent");
+    const rows = await this.db
+      .select()
+      .from(recent)
+      .orderBy(asc(recent.created_at), asc(recent.id));
+    this.conversations = rows.map((r) => ({
       role: r.role,
       content: r.content,
       created_at: r.created_at,
@@ -1,10 +1,32 @@
-import { eq } from "drizzle-orm";
+import { eq, sql } from "drizzle-orm";
 import type { drizzle } from "drizzle-orm/bun-sqlite";
 import { usersTable } from "../schemas/admin-schema.ts";
 import type { User, UserRole } from "../types.ts";
 
+/** Prepared statements for the lookups run on every authenticated request. */
+function prepareLookups(db: ReturnType<typeof drizzle>) {
+  return {
+    byToken: db
+      .select()
+      .from(usersTable)
+      .where(eq(usersTable.token, sql.placeholder("token")))
+      .limit(1)
+      .prepare(),
+    byId: db
+      .select()
+      .from(usersTable)
+      .where(eq(usersTable.id, sql.placeholder("id")))
+      .limit(1)
+      .prepare(),
+  };
+}
+
 export class UserRepository {
-  constructor(private readonly db: ReturnType<typeof drizzle>) {}
+  private readonly lookups: ReturnType<typeof prepareLookups>;
+
+  constructor(private readonly db: ReturnType<typeof drizzle>) {
+    this.lookups = prepareLookups(db);
+  }
 
   async register(name: string, role: UserRole = "user"): Promise<User> {
     const id = crypto.randomUUID();
@@ -23,23 +45,11 @@ export class UserRepository {
   }
 
   async getByToken(token: string): Promise<User | null> {
-    const rows = await this.db
-      .select()
-      .from(usersTable)
-      .where(eq(usersTable.token, token))
-      .limit(1);
-
-    return rows[0] ?? null;
+    return (await this.lookups.byToken.get({ token })) ?? null;
   }
 
   async getById(id: string): Promise<User | null> {
-    const rows = await this.db
-      .select()
-      .from(usersTable)
-      .where(eq(usersTable.id, id))
-      .limit(1);
-
-    return rows[0] ?? null;
+    return (await this.lookups.byId.get({ id })) ?? null;
   }
 
   async list(): Promise<User[]> {
@@ -1,7 +1,10 @@
-import { eq, and, desc } from "drizzle-orm";
+import { eq, and, desc, getTableColumns } from "drizzle-orm";
 import type { drizzle } from "drizzle-orm/bun-sqlite";
 import { webhooksTable, webhookEventsTable } from "../schemas/admin-schema.ts";
-import type { Webhook, WebhookEvent, WebhookEventStatus } from "../index.ts";
+import type { Webhook, WebhookEvent, WebhookEventStatus } from "../types.ts";
+
+// Every column except the signing secret, which is only shown at creation
+const { secret: _, ...publicColumns } = getTableColumns(webhooksTable);
 
 export class WebhookRepository {
   constructor(private readonly db: ReturnType<typeof drizzle>) {}
@@ -22,33 +25,36 @@ export class WebhookRepository {
   }
 
   async getBySlug(slug: string): Promise<Webhook | null> {
-    const rows = await this.db
+    const row = await this.db
       .select()
       .from(webhooksTable)
       .where(eq(webhooksTable.slug, slug))
-      .limit(1);
+      .limit(1)
+      .get();
 
-    return (rows[0] as Webhook | undefined) ?? null;
+    return (row as Webhook | undefined) ?? null;
   }
 
   async getById(id: string): Promise<Webhook | null> {
-    const rows = await this.db
+    const row = await this.db
       .select()
       .from(webhooksTable)
       .where(eq(webhooksTable.id, id))
-      .limit(1);
+      .limit(1)
+      .get();
 
-    return (rows[0] as Webhook | undefined) ?? null;
+    return (row as Webhook | undefined) ?? null;
   }
 
-  async list(limit = 50): Promise<Webhook[]> {
+  /** List webhooks without their secrets. */
+  async list(limit = 50): Promise<Omit<Webhook, "secret">[]> {
     const rows = await this.db
-      .select()
+      .select(publicColumns)
       .from(webhooksTable)
       .orderBy(desc(webhooksTable.created_at))
       .limit(limit);
 
-    return rows as Webhook[];
+    return rows as Omit<Webhook, "secret">[];
   }
 
   async update(
@@ -99,12 +105,16 @@ export class WebhookRepository {
     return rows as WebhookEvent[];
   }
 
-  async findByExternalId(
+  /**
+   * Id of an already-recorded event with this external id, if any. Selects
+   * only the id so dedup checks don't read back stored headers and payloads.
+   */
+  async findEventIdByExternalId(
     webhookId: string,
     externalId: string,
-  ): Promise<WebhookEvent | null> {
-    const rows = await this.db
-      .select()
+  ): Promise<string | null> {
+    const row = await this.db
+      .select({ id: webhookEventsTable.id })
       .from(webhookEventsTable)
       .where(
         and(
@@ -112,9 +122,10 @@ export class WebhookRepository {
           eq(webhookEventsTable.external_id, externalId),
         ),
       )
-      .limit(1);
+      .limit(1)
+      .get();
 
-    return (rows[0] as WebhookEvent | undefined) ?? null;
+    return row?.id ?? null;
   }
 
   async updateEventStatus(
@@ -122,15 +133,9 @@ export class WebhookRepository {
     status: WebhookEventStatus,
     error?: string,
   ): Promise<void> {
-    const updates: Record<string, unknown> = {
-      status,
-      processed_at: Date.now(),
-    };
-    if (error !== undefined) updates.error = error;
-
     await this.db
       .update(webhookEventsTable)
-      .set(updates)
+      .set({ status, error, processed_at: Date.now() })
       .where(eq(webhookEventsTable.id, id));
   }
 }
@@ -1,7 +1,7 @@
 import { eq, desc } from "drizzle-orm";
 import type { drizzle } from "drizzle-orm/bun-sqlite";
 import { workflowRunsTable } from "../schemas/admin-schema.ts";
-import type { WorkflowRun, WorkflowStatus } from "../index.ts";
+import type { WorkflowRun, WorkflowStatus } from "../types.ts";
 
 export class WorkflowRepository {
   constructor(private readonly db: ReturnType<typeof drizzle>) {}
@@ -26,32 +26,31 @@ export class WorkflowRepository {
       Pick<WorkflowRun<T>, "status" | "state" | "error" | "completed_at">
     >,
   ): Promise<void> {
-    const dbUpdates: Record<string, unknown> = {
-      updated_at: Date.now(),
-    };
-
-    if (updates.status !== undefined) dbUpdates.status = updates.status;
-    if (updates.state !== undefined)
-      dbUpdates.state = JSON.stringify(updates.state);
-    if (updates.error !== undefined) dbUpdates.error = updates.error;
-    if (updates.completed_at !== undefined)
-      dbUpdates.completed_at = updates.completed_at;
-
+    // Drizzle skips undefined values in set(), so absent fields stay untouched
     await this.db
       .update(workflowRunsTable)
-      .set(dbUpdates)
+      .set({
+        status: updates.status,
+        state:
+          updates.state !== undefined
+            ? JSON.stringify(updates.state)
+            : undefined,
+        error: updates.error,
+        completed_at: updates.completed_at,
+        updated_at: Date.now(),
+      })
       .where(eq(workflowRunsTable.id, id));
   }
 
   async get<T>(id: string): Promise<WorkflowRun<T> | null> {
-    const rows = await this.db
+    const row = await this.db
       .select()
       .from(workflowRunsTable)
       .where(eq(workflowRunsTable.id, id))
-      .limit(1);
+      .limit(1)
+      .get();
 
-    if (rows.length === 0) return null;
-    return this.toWorkflowRun<T>(rows[0]!);
+    return row ? this.toWorkflowRun<T>(row) : null;
   }
 
   async listByStatus<T>(
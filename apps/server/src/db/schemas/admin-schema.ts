@@ -51,9 +51,10 @@ export const workflowRunsTable = table(
     updated_at: int().notNull(),
     completed_at: int(),
   },
+  // Composite indexes match listByStatus/listByAgent: filter, then newest first
   (t) => [
-    index("workflow_runs_status_idx").on(t.status),
-    index("workflow_runs_agent_idx").on(t.agent_id),
+    index("workflow_runs_status_idx").on(t.status, t.started_at),
+    index("workflow_runs_agent_idx").on(t.agent_id, t.started_at),
   ],
 );
 
@@ -71,7 +72,7 @@ export const webhookEventsTable = table(
     processed_at: int(),
   },
   (t) => [
-    index("wh_events_webhook_idx").on(t.webhook_id),
+    index("wh_events_webhook_idx").on(t.webhook_id, t.received_at),
     index("wh_events_received_idx").on(t.received_at),
     uniqueIndex("wh_events_dedup_idx").on(t.webhook_id, t.external_id),
   ],
@@ -2,13 +2,14 @@ import Elysia from "elysia";
 import { routes } from "./api/routes";
 import { Yae } from "./core";
 
-// Initialize Yae (the server)
-const yae = await Yae.initialize();
+async function main() {
+  // Initialize Yae (the server)
+  const yae = await Yae.initialize();
 
-const PORT = process.env.PORT || 3000;
-new Elysia().use(routes).listen(PORT);
+  const PORT = process.env.PORT || 3000;
+  new Elysia().use(routes).listen(PORT);
 
-console.log(`
+  console.log(`
 ╔════════════════════════════════════════╗
 ║                 Y.A.E.                 ║
 ╚════════════════════════════════════════╝
@@ -20,11 +21,32 @@ console.log(`
 Press Ctrl+C to gracefully shutdown
 `);
 
+  // Register shutdown handlers
+  process.once("SIGINT", () => shutdown("SIGINT"));
+  process.once("SIGTERM", () => shutdown("SIGTERM"));
+
+  // Handle uncaught errors
+  process.once("uncaughtException", (error) => {
+    console.error("[Fatal] Uncaught exception:", error);
+    shutdown("UNCAUGHT_EXCEPTION").catch(() => process.exit(1));
+  });
+
+  process.once("unhandledRejection", (reason, promise) => {
+    console.error(
+      "[Fatal] Unhandled rejection at:",
+      promise,
+      "reason:",
+      reason,
+    );
+    shutdown("UNHANDLED_REJECTION").catch(() => process.exit(1));
+  });
+}
+
 async function shutdown(signal: string) {
   console.log(`\n[Shutdown] Received ${signal}, shutting down gracefully...`);
 
   try {
-    await yae.shutdown();
+    await Yae.getInstance().shutdown();
     console.log("[Shutdown] Cleanup complete. Goodbye!");
     process.exit(0);
   } catch (error) {
@@ -33,17 +55,7 @@ async function shutdown(signal: string) {
   }
 }
 
-// Register shutdown handlers
-process.once("SIGINT", () => shutdown("SIGINT"));
-process.once("SIGTERM", () => shutdown("SIGTERM"));
-
-// Handle uncaught errors
-process.once("uncaughtException", (error) => {
-  console.error("[Fatal] Uncaught exception:", error);
-  shutdown("UNCAUGHT_EXCEPTION").catch(() => process.exit(1));
-});
-
-process.once("unhandledRejection", (reason, promise) => {
-  console.error("[Fatal] Unhandled rejection at:", promise, "reason:", reason);
-  shutdown("UNHANDLED_REJECTION").catch(() => process.exit(1));
-});
+// Only start the server when run directly, not when imported
+if (import.meta.main) {
+  await main();
+}
@@ -191,6 +191,28 @@ describe("MessagesRepository", () => {
     expect(contents).toEqual(["first", "second", "third"]);
   });
 
+  test("saveMany() persists all messages in order", async () => {
+    const dir = tempDbDir();
+
+    const ctx1 = await AgentContext.create("agent", dir);
+    await ctx1.messages.saveMany([
+      { role: "user", content: "first" },
+      { role: "assistant", content: "second" },
+      { role: "user", content: "third" },
+    ]);
+    expect(ctx1.messages.getMessageHistory()).toHaveLength(3);
+
+    const ctx2 = await AgentContext.create("agent", dir);
+    const contents = ctx2.messages.getMessageHistory().map((m) => m.content);
+    expect(contents).toEqual(["first", "second", "third"]);
+  });
+
+  test("saveMany() with no messages is a no-op", async () => {
+    const ctx = await AgentContext.create("agent", tempDbDir());
+    await ctx.messages.saveMany([]);
+    expect(await ctx.messages.getTotalCount()).toBe(0);
+  });
+
   test("empty database loads empty messages", async () => {
     const ctx = await AgentContext.create("agent", tempDbDir());
     expect(ctx.messages.getMessageHistory()).toEqual([]);
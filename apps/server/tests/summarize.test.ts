@@ -1,5 +1,5 @@
 import { tmpdir } from "node:os";
-import { test, expect, mock, beforeEach } from "bun:test";
+import { test, expect, mock, beforeAll, afterAll, beforeEach } from "bun:test";
 
 // --- BAML mocks (hoisted before imports that depend on @yae/baml) ---
 
@@ -25,6 +25,17 @@ function tempAdminDbPath(): string {
   return `${tmpdir()}/yae-sum-test-${crypto.randomUUID()}.db`;
 }
 
+// One admin DB shared by every test in this file.
+let admin: AdminContext;
+
+beforeAll(async () => {
+  admin = await AdminContext.create(tempAdminDbPath());
+});
+
+afterAll(() => {
+  admin.close();
+});
+
 function makeMessages(
   count: number,
   startRole: "user" | "assistant" = "user",
@@ -105,7 +116,6 @@ test("chunkMessages: single message → [[msg]]", () => {
 
 test("summarize workflow: skip when no messages exceed threshold", async () => {
   const ctx = await AgentContext.create("test-agent", ":memory:");
-  const admin = await AdminContext.create(tempAdminDbPath());
   try {
     const result = await runWorkflow(
       summarizeWorkflow,
@@ -120,13 +130,11 @@ test("summarize workflow: skip when no messages exceed threshold", async () => {
     expect(mockMergeSummaries).not.toHaveBeenCalled();
   } finally {
     await ctx.close();
-    admin.close();
   }
 });
 
 test("summarize workflow: end-to-end with 70 messages", async () => {
   const ctx = await AgentContext.create("test-agent", ":memory:");
-  const admin = await AdminContext.create(tempAdminDbPath());
   try {
     // conversation_summary must exist for the store node to update it
     await ctx.memory.set(
@@ -135,12 +143,7 @@ test("summarize workflow: end-to-end with 70 messages", async () => {
       "Initial summary",
     );
 
-    for (let i = 0; i < 70; i++) {
-      await ctx.messages.save({
-        role: i % 2 === 0 ? "user" : "assistant",
-        content: `Message ${i + 1}`,
-      });
-    }
+    await ctx.messages.saveMany(makeMessages(70));
 
     const result = await runWorkflow(
       summarizeWorkflow,
@@ -161,13 +164,11 @@ test("summarize workflow: end-to-end with 70 messages", async () => {
     );
   } finally {
     await ctx.close();
-    admin.close();
   }
 });
 
 test("summarize workflow: existing summary forwarded to mergeSummaries", async () => {
   const ctx = await AgentContext.create("test-agent", ":memory:");
-  const admin = await AdminContext.create(tempAdminDbPath());
   try {
     const existingContent = "Previous conversation summary here.";
     await ctx.memory.set(
@@ -176,12 +177,7 @@ test("summarize workflow: existing summary forwarded to mergeSummaries", async (
       existingContent,
     );
 
-    for (let i = 0; i < 70; i++) {
-      await ctx.messages.save({
-        role: i % 2 === 0 ? "user" : "assistant",
-        content: `Message ${i + 1}`,
-      });
-    }
+    await ctx.messages.saveMany(makeMessages(70));
 
     const result = await runWorkflow(
       summarizeWorkflow,
@@ -200,22 +196,15 @@ test("summarize workflow: existing summary forwarded to mergeSummaries", async (
     );
   } finally {
     await ctx.close();
-    admin.close();
   }
 });
 
 test("summarize workflow: multiple chunks for 90 messages", async () => {
   const ctx = await AgentContext.create("test-agent", ":memory:");
-  const admin = await AdminContext.create(tempAdminDbPath());
   try {
     await ctx.memory.set("conversation_summary", "Conversation Summary", "");
 
-    for (let i = 0; i < 90; i++) {
-      await ctx.messages.save({
-        role: i % 2 === 0 ? "user" : "assistant",
-        content: `Message ${i + 1}`,
-      });
-    }
+    await ctx.messages.saveMany(makeMessages(90));
 
     const result = await runWorkflow(
       summarizeWorkflow,
@@ -233,6 +222,5 @@ test("summarize workflow: multiple chunks for 90 messages", async () => {
     expect(mergeCall[0]).toHaveLength(2);
   } finally {
     await ctx.close();
-    admin.close();
   }
 });
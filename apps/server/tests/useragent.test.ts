@@ -1,4 +1,4 @@
-import { test, expect, mock, beforeEach } from "bun:test";
+import { test, expect, mock, beforeEach, setSystemTime } from "bun:test";
 
 // --- BAML mock (hoisted before imports that depend on @yae/baml) ---
 
@@ -560,3 +560,44 @@ test("file_read on missing file — yields TOOL_ERROR, loop continues", async ()
     await agent.close();
   }
 });
+
+// ============================================================================
+// Test 14: buildContext prompt shape
+// ============================================================================
+
+test("buildContext — inserts multi-line memory and file XML verbatim", async () => {
+  setSystemTime(new Date(2026, 0, 5, 9, 7));
+  const { agent } = await freshAgent();
+  try {
+    await agent.files.writeFile("/a.txt", "aaa", "utf-8");
+    await agent.files.mkdir("/notes");
+    await agent.files.writeFile("/notes/todo.txt", "todo", "utf-8");
+
+    const memoryXML = agent.memory.toXML();
+    expect(memoryXML).toContain("\n<block ");
+
+    const context = await agent.buildContext();
+
+    expect(context).toBe(
+      [
+        "<metadata>",
+        "The current date and time is Monday 5 January 2026 9:07 AM.",
+        "</metadata>",
+        "",
+        "These memory blocks are currently in your active attention:",
+        memoryXML,
+        "",
+        "These files are currently stored in your file system:",
+        "<files>",
+        "├── notes/",
+        "│   └── todo.txt (4b)",
+        "└── a.txt (3b)",
+        "",
+        "</files>",
+      ].join("\n"),
+    );
+  } finally {
+    setSystemTime();
+    await agent.close();
+  }
+});
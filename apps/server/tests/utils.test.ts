@@ -1,5 +1,5 @@
 import { describe, test, expect } from "bun:test";
-import { isPublicUrl, withTimeout } from "@yae/core/agents/utils";
+import { dedent, isPublicUrl, withTimeout } from "@yae/core/agents/utils";
 
 // ============================================================================
 // isPublicUrl — SSRF guard
@@ -118,3 +118,29 @@ describe("withTimeout", () => {
     expect(result).toBe(42);
   });
 });
+
+// ============================================================================
+// dedent
+// ============================================================================
+
+describe("dedent", () => {
+  test("strips common indentation and surrounding blank lines", () => {
+    const text = dedent`
+      Hello,
+        World!
+    `;
+    expect(text).toBe("Hello,\n  World!");
+  });
+
+  test("inserts multi-line values verbatim", () => {
+    const render = (value: string) => dedent`
+      <outer>
+      ${value}
+      </outer>`;
+    expect(render("<a>\n<b/>\n</a>")).toBe(
+      "<outer>\n<a>\n<b/>\n</a>\n</outer>",
+    );
+    // Same call site, different value — reuses the dedented template
+    expect(render("x")).toBe("<outer>\nx\n</outer>");
+  });
+});
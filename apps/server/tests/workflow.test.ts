@@ -1,5 +1,5 @@
 import { tmpdir } from "node:os";
-import { test, expect } from "bun:test";
+import { test, expect, beforeAll, afterAll } from "bun:test";
 import { AgentContext, AdminContext } from "@yae/db/context.ts";
 import { defineWorkflow, runWorkflow } from "@yae/core/workflows/utils.ts";
 
@@ -11,6 +11,18 @@ function tempAdminDbPath(): string {
   return `${tmpdir()}/yae-wf-test-${crypto.randomUUID()}.db`;
 }
 
+// One admin DB shared by every test in this file.
+// Workflow runs are keyed by a fresh UUID, so tests don't see each other's rows.
+let admin: AdminContext;
+
+beforeAll(async () => {
+  admin = await AdminContext.create(tempAdminDbPath());
+});
+
+afterAll(() => {
+  admin.close();
+});
+
 // ============================================================================
 // Workflow Types Tests
 // ============================================================================
@@ -44,7 +56,6 @@ test("AgentState provides access to context and mutable data", async () => {
   });
 
   const ctx = await AgentContext.create("test-agent", getTestDbPath());
-  const admin = await AdminContext.create(tempAdminDbPath());
   try {
     const result = await runWorkflow(
       workflow,
@@ -57,7 +68,6 @@ test("AgentState provides access to context and mutable data", async () => {
     expect(result.state.steps).toEqual(["checked"]);
   } finally {
     await ctx.close();
-    admin.close();
   }
 });
 
@@ -102,7 +112,6 @@ test("Workflow node follows prep -> exec -> post pattern", async () => {
   });
 
   const ctx = await AgentContext.create("test-agent", getTestDbPath());
-  const admin = await AdminContext.create(tempAdminDbPath());
   try {
     const result = await runWorkflow(
       workflow,
@@ -116,7 +125,6 @@ test("Workflow node follows prep -> exec -> post pattern", async () => {
     expect(result.state.phases).toEqual(["prep", "post"]);
   } finally {
     await ctx.close();
-    admin.close();
   }
 });
 
@@ -148,7 +156,6 @@ test("Workflow parallel node processes items in parallel", async () => {
   });
 
   const ctx = await AgentContext.create("test-agent", getTestDbPath());
-  const admin = await AdminContext.create(tempAdminDbPath());
   try {
     const result = await runWorkflow(
       workflow,
@@ -161,7 +168,6 @@ test("Workflow parallel node processes items in parallel", async () => {
     expect(result.state.processed).toEqual([2, 4, 6, 8, 10]);
   } finally {
     await ctx.close();
-    admin.close();
   }
 });
 
@@ -217,7 +223,6 @@ test("Workflow chains multiple nodes sequentially", async () => {
   });
 
   const ctx = await AgentContext.create("test-agent", getTestDbPath());
-  const admin = await AdminContext.create(tempAdminDbPath());
   try {
     const result = await runWorkflow(
       workflow,
@@ -231,7 +236,6 @@ test("Workflow chains multiple nodes sequentially", async () => {
     expect(result.state.steps).toEqual(["trim", "uppercase", "prefix"]);
   } finally {
     await ctx.close();
-    admin.close();
   }
 });
 
@@ -295,7 +299,6 @@ test("Workflow supports conditional branching", async () => {
   });
 
   const ctx = await AgentContext.create("test-agent", getTestDbPath());
-  const admin = await AdminContext.create(tempAdminDbPath());
   try {
     const result = await runWorkflow(
       workflow,
@@ -309,7 +312,6 @@ test("Workflow supports conditional branching", async () => {
     expect(result.state.path).toEqual(["router", "high-value", "finalize"]);
   } finally {
     await ctx.close();
-    admin.close();
   }
 });
 
@@ -358,7 +360,6 @@ test("Workflow can read and write to agent memory", async () => {
   });
 
   const ctx = await AgentContext.create("test-agent", getTestDbPath());
-  const admin = await AdminContext.create(tempAdminDbPath());
   try {
     const result = await runWorkflow(
       workflow,
@@ -374,7 +375,6 @@ test("Workflow can read and write to agent memory", async () => {
     expect(ctx.memory.get("test-key")?.content).toBe("test-value");
   } finally {
     await ctx.close();
-    admin.close();
   }
 });
 
@@ -399,7 +399,6 @@ test("Workflow run is persisted to database", async () => {
   });
 
   const ctx = await AgentContext.create("test-agent", getTestDbPath());
-  const admin = await AdminContext.create(tempAdminDbPath());
   try {
     const result = await runWorkflow(
       workflow,
@@ -417,11 +416,9 @@ test("Workflow run is persisted to database", async () => {
 
     // Verify history via admin.workflows
     const history = await admin.workflows.listByStatus<SimpleData>("completed");
-    expect(history.length).toBeGreaterThan(0);
-    expect(history[0]!.id).toBe(result.run);
+    expect(history.map((r) => r.id)).toContain(result.run);
   } finally {
     await ctx.close();
-    admin.close();
   }
 });
 
@@ -450,7 +447,6 @@ test("Workflow accepts initial data override", async () => {
   });
 
   const ctx = await AgentContext.create("test-agent", getTestDbPath());
-  const admin = await AdminContext.create(tempAdminDbPath());
   try {
     const result = await runWorkflow(
       workflow,
@@ -469,7 +465,6 @@ test("Workflow accepts initial data override", async () => {
     expect(result.state.processed).toBe(true);
   } finally {
     await ctx.close();
-    admin.close();
   }
 });
 
@@ -497,7 +492,6 @@ test("Workflow handles node errors gracefully", async () => {
   });
 
   const ctx = await AgentContext.create("test-agent", getTestDbPath());
-  const admin = await AdminContext.create(tempAdminDbPath());
   try {
     const result = await runWorkflow(
       workflow,
@@ -510,7 +504,6 @@ test("Workflow handles node errors gracefully", async () => {
     expect(result.state.errorHandled).toBe(true);
   } finally {
     await ctx.close();
-    admin.close();
   }
 });
 
@@ -531,7 +524,6 @@ test("Workflow fails when error is not handled", async () => {
   });
 
   const ctx = await AgentContext.create("test-agent", getTestDbPath());
-  const admin = await AdminContext.create(tempAdminDbPath());
   try {
     const result = await runWorkflow(
       workflow,
@@ -544,7 +536,6 @@ test("Workflow fails when error is not handled", async () => {
     expect(result.error).toContain("Unhandled failure");
   } finally {
     await ctx.close();
-    admin.close();
   }
 });
 
@@ -568,7 +559,6 @@ test("Workflow tracks execution duration", async () => {
   });
 
   const ctx = await AgentContext.create("test-agent", getTestDbPath());
-  const admin = await AdminContext.create(tempAdminDbPath());
   try {
     const result = await runWorkflow(
       workflow,
@@ -581,7 +571,6 @@ test("Workflow tracks execution duration", async () => {
     expect(result.duration).toBeGreaterThanOrEqual(50);
   } finally {
     await ctx.close();
-    admin.close();
   }
 });
 
@@ -692,7 +681,6 @@ test("Complex workflow: multi-step data processing pipeline", async () => {
   });
 
   const ctx = await AgentContext.create("test-agent", getTestDbPath());
-  const admin = await AdminContext.create(tempAdminDbPath());
   try {
     const result = await runWorkflow(
       workflow,
@@ -717,6 +705,5 @@ test("Complex workflow: multi-step data processing pipeline", async () => {
     expect(ctx.memory.get("processed-data")?.content).toBe("TEST: 84");
   } finally {
     await ctx.close();
-    admin.close();
   }
 });
@@ -9,9 +9,14 @@ import type {
 import type { partial_types } from "../baml_client/partial_types";
 import type { BamlStream } from "@boundaryml/baml";
 
-async function client() {
-  const { b } = await import("../baml_client");
-  return b;
+type BamlClient = (typeof import("../baml_client"))["b"];
+
+let clientPromise: Promise<BamlClient> | null = null;
+
+// Loaded on first call and reused afterwards.
+function client(): Promise<BamlClient> {
+  clientPromise ??= import("../baml_client").then((m) => m.b);
+  return clientPromise;
 }
 
 export type {